@@ -1,14 +1,19 @@
-from typing import Optional, List
+from typing import Deque, Dict, Optional, Tuple
 import uvicorn
 from fastapi import FastAPI, WebSocket, HTTPException
 from starlette.middleware.cors import CORSMiddleware
 
-import json
+import orjson
 import asyncio
-from time import sleep
+import logging
+from collections import deque
 
 from .tobii_pro_eye_tracker import TobiiProEyeTracker, GazePoint, tr
 from .models import TobiiGazeData
+from .config import BROADCAST_BATCH_WINDOW, MAX_PENDING_SAMPLES
+
+# Share uvicorn's logger so `--log-level debug` enables the per-sample logs
+logger = logging.getLogger("uvicorn.error")
 
 app = FastAPI()
 app.add_middleware(
@@ -21,32 +26,47 @@ app.add_middleware(
 
 
 eyetracker: Optional[TobiiProEyeTracker] = None
-connected_clients: List[WebSocket] = []
+# Each client holds a bounded buffer of unsent payloads and an event to wake its sender
+connected_clients: Dict[WebSocket, Tuple[Deque[bytes], asyncio.Event]] = {}
 main_loop = None
+device_task: Optional[asyncio.Task] = None
+
+EMPTY_EYE_POSITION = {"x": None, "y": None, "z": None}
 
 
 def handle_gaze_data(gaze_data: TobiiGazeData):
     broadcast_gaze_data(gaze_data)
 
 
-def wait_for_device():
-    global eyetracker
+def update_gaze_listener():
+    # Detach the listener while nobody is connected so the tracker skips building TobiiGazeData
+    if eyetracker:
+        eyetracker.on_gaze_data = handle_gaze_data if connected_clients else None
 
-    while True:
-        if eyetracker:
-            break
 
-        devices = tr.find_all_eyetrackers()
-        if devices:
-            eyetracker = TobiiProEyeTracker(devices[0])
-            eyetracker.on_gaze_data = handle_gaze_data
-            eyetracker.subscribe()
+def connect_device(device: tr.EyeTracker) -> TobiiProEyeTracker:
+    tracker = TobiiProEyeTracker(device)
+    tracker.subscribe()
+    return tracker
+
 
-        sleep(1)
+async def wait_for_device():
+    global eyetracker
+    loop = asyncio.get_running_loop()
+
+    while not eyetracker:
+        # Discovery, setup and subscription are blocking SDK calls, so run them on a worker thread
+        devices = await loop.run_in_executor(None, tr.find_all_eyetrackers)
+        if devices:
+            eyetracker = await loop.run_in_executor(None, connect_device, devices[0])
+            update_gaze_listener()
+        else:
+            await asyncio.sleep(1)
 
 
 def broadcast_gaze_data(gaze_data: TobiiGazeData):
-    # print("[GazeData]", gaze_data)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("[GazeData] %s", gaze_data)
     if not connected_clients or not main_loop:
         return
 
@@ -60,12 +80,12 @@ def broadcast_gaze_data(gaze_data: TobiiGazeData):
     screen_x = (left_eye_screen_x + right_eye_screen_x) / 2
     screen_y = (left_eye_screen_y + right_eye_screen_y) / 2
     
-    # Get eye position data if available
-    left_eye_position = None
-    right_eye_position = None
+    # Get eye position data if available (NaN components become None)
+    left_eye_position = EMPTY_EYE_POSITION
+    right_eye_position = EMPTY_EYE_POSITION
     if eyetracker:
-        left_eye_position = eyetracker.left_eye_position
-        right_eye_position = eyetracker.right_eye_position
+        left_eye_position = eyetracker.left_eye_position.to_dict()
+        right_eye_position = eyetracker.right_eye_position.to_dict()
     
     # Create message in GazePointInput format with additional fields
     message_data = {
@@ -77,52 +97,82 @@ def broadcast_gaze_data(gaze_data: TobiiGazeData):
         "leftEye": {
             "screenX": left_eye_screen_x,
             "screenY": left_eye_screen_y,
-            "positionX": left_eye_position.x if left_eye_position and left_eye_position.is_valid else None,
-            "positionY": left_eye_position.y if left_eye_position and left_eye_position.is_valid else None,
-            "positionZ": left_eye_position.z if left_eye_position and left_eye_position.is_valid else None,
+            "positionX": left_eye_position["x"],
+            "positionY": left_eye_position["y"],
+            "positionZ": left_eye_position["z"],
             "pupilSize": gaze_data.left_eye.pupil_diameter if gaze_data.left_eye.is_pupil_valid else None
         },
         "rightEye": {
             "screenX": right_eye_screen_x,
             "screenY": right_eye_screen_y,
-            "positionX": right_eye_position.x if right_eye_position and right_eye_position.is_valid else None,
-            "positionY": right_eye_position.y if right_eye_position and right_eye_position.is_valid else None,
-            "positionZ": right_eye_position.z if right_eye_position and right_eye_position.is_valid else None,
+            "positionX": right_eye_position["x"],
+            "positionY": right_eye_position["y"],
+            "positionZ": right_eye_position["z"],
             "pupilSize": gaze_data.right_eye.pupil_diameter if gaze_data.right_eye.is_pupil_valid else None
         }
     }
     
-    message = json.dumps(message_data)
-    disconnected_clients = []
+    # Encode once and share the same bytes across every client
+    payload = orjson.dumps(message_data, option=orjson.OPT_SERIALIZE_NUMPY)
+
+    # Cross to the event loop once per sample; the fan-out to clients happens there
+    main_loop.call_soon_threadsafe(queue_gaze_data, payload)
+
+
+def queue_gaze_data(payload: bytes):
+    for pending, event in connected_clients.values():
+        # The buffer is bounded, so a slow client drops its oldest samples
+        pending.append(payload)
+        event.set()
 
-    for client in connected_clients:
-        try:
-            print("Sending message to client:", message)
-            asyncio.run_coroutine_threadsafe(client.send_text(message), main_loop)
-        except Exception as e:
-            print(f"Error sending to client: {e}")
-            disconnected_clients.append(client)
 
-    # Remove disconnected clients
-    for client in disconnected_clients:
-        connected_clients.remove(client)
+async def send_gaze_data(websocket: WebSocket, pending: Deque[bytes], event: asyncio.Event):
+    try:
+        while True:
+            await event.wait()
+            # Let a few more samples arrive so they share one frame
+            await asyncio.sleep(BROADCAST_BATCH_WINDOW)
+            event.clear()
+
+            batch = []
+            while pending:
+                batch.append(pending.popleft())
+
+            if not batch:
+                continue
+            elif len(batch) == 1:
+                payload = batch[0]
+            else:
+                payload = b'{"type":"batch","samples":[' + b",".join(batch) + b"]}"
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Sending message to client: %s", payload)
+            await websocket.send_bytes(payload)
+    except Exception as e:
+        logger.warning("Error sending to client: %s", e)
 
 
 @app.websocket("/eye_tracking")
 async def websocket_endpoint(websocket: WebSocket):
     await websocket.accept()
-    connected_clients.append(websocket)
+    pending: Deque[bytes] = deque(maxlen=MAX_PENDING_SAMPLES)
+    event = asyncio.Event()
+    connected_clients[websocket] = (pending, event)
+    update_gaze_listener()
+    sender = asyncio.create_task(send_gaze_data(websocket, pending, event))
 
     try:
         while True:
             data = await websocket.receive_text()
-            print("Received:", data)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Received: %s", data)
             await websocket.send_text('{"status": "ok"}')
     except Exception as e:
-        print(f"Error: {e}")
+        logger.warning("Error: %s", e)
     finally:
-        if websocket in connected_clients:
-            connected_clients.remove(websocket)
+        connected_clients.pop(websocket, None)
+        update_gaze_listener()
+        sender.cancel()
         await websocket.close()
 
 
@@ -136,7 +186,7 @@ async def calibration_start():
 
         return { "message": "ok" }
     except tr.EyeTrackerInvalidOperationError:
-        print("Already calibration? leaved.")
+        logger.info("Already calibration? leaved.")
         eyetracker.calibration.leave_calibration_mode()
         eyetracker.calibration.enter_calibration_mode()
 
@@ -148,7 +198,7 @@ async def calibration_collect(point: GazePoint):
     if not eyetracker:
         raise HTTPException(status_code=400, detail="CONNECT EYETRACKER FIRST")
 
-    print("Collect:", point.x, point.y)
+    logger.debug("Collect: %s %s", point.x, point.y)
 
     if eyetracker.calibration.collect_data(point.x, point.y) == tr.CALIBRATION_STATUS_SUCCESS:
         return { "message": "ok" }
@@ -163,12 +213,12 @@ async def calibration_result(force: bool = False):
 
     calibration_result = eyetracker.calibration.compute_and_apply()
 
-    # print calibration result
-    print(calibration_result.status, len(calibration_result.calibration_points))
+    # log calibration result
+    logger.info("%s %d", calibration_result.status, len(calibration_result.calibration_points))
     for point in calibration_result.calibration_points:
-        print(point.position_on_display_area, ":")
+        logger.info("%s :", point.position_on_display_area)
         for sample in point.calibration_samples:
-            print(sample.left_eye.position_on_display_area, sample.right_eye.position_on_display_area)
+            logger.info("%s %s", sample.left_eye.position_on_display_area, sample.right_eye.position_on_display_area)
 
     if force or calibration_result.status == tr.CALIBRATION_STATUS_SUCCESS:
         eyetracker.calibration.leave_calibration_mode()
@@ -184,13 +234,15 @@ async def calibration_result(force: bool = False):
 
 @app.on_event("startup")
 async def startup():
-    global main_loop
+    global main_loop, device_task
     main_loop = asyncio.get_event_loop()
-    asyncio.create_task(asyncio.to_thread(wait_for_device))
+    device_task = asyncio.create_task(wait_for_device())
 
 
 @app.on_event("shutdown")
 async def shutdown():
+    if device_task:
+        device_task.cancel()
     if eyetracker:
         eyetracker.unsubscribe()
 
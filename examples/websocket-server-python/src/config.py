@@ -1,6 +1,10 @@
+from typing import Final, Tuple
+
 # WebSocket settings
-WEBSOCKET_PORT = 8000
-WEBSOCKET_HOST = "localhost"
+WEBSOCKET_PORT: Final[int] = 8000
+WEBSOCKET_HOST: Final[str] = "localhost"
+BROADCAST_BATCH_WINDOW: Final[float] = 0.010  # Seconds to collect gaze samples into one frame
+MAX_PENDING_SAMPLES: Final[int] = 32  # Unsent gaze samples per client before the oldest is dropped
 
 # Eye tracker settings
-CALIBRATION_POINTS = [(0.5, 0.5), (0.1, 0.1), (0.1, 0.9), (0.9, 0.1), (0.9, 0.9)]
\ No newline at end of file
+CALIBRATION_POINTS: Final[Tuple[Tuple[float, float], ...]] = ((0.5, 0.5), (0.1, 0.1), (0.1, 0.9), (0.9, 0.1), (0.9, 0.9))
@@ -1,20 +1,38 @@
-from collections import deque
-from math import pi, sqrt
+from math import pi
 
+import numpy as np
 
-def _smoothing_factor(t_e, cutoff):
-    r = 2 * pi * cutoff * t_e
-    return r / (r + 1)
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional (`uv sync --extra jit`); fall back to plain Python functions
+    def njit(*args, **kwargs):
+        return lambda func: func
 
 
-def _exponential_smoothing(a, x, x_prev):
-    return a * x + (1 - a) * x_prev
+@njit(cache=True, fastmath=True, nogil=True)
+def _one_euro_step(t_e, x, y, x_prev, y_prev, dx_prev, dy_prev, min_cutoff, beta, d_cutoff):
+    # The filtered derivative of the signal (both axes share the smoothing factor).
+    r = 2 * pi * d_cutoff * t_e
+    a_d = r / (r + 1)
+    dx_hat = a_d * ((x - x_prev) / t_e) + (1 - a_d) * dx_prev
+    dy_hat = a_d * ((y - y_prev) / t_e) + (1 - a_d) * dy_prev
+
+    # The filtered signal.
+    r = 2 * pi * (min_cutoff + beta * abs(dx_hat)) * t_e
+    a_x = r / (r + 1)
+    r = 2 * pi * (min_cutoff + beta * abs(dy_hat)) * t_e
+    a_y = r / (r + 1)
+    x_hat = a_x * x + (1 - a_x) * x_prev
+    y_hat = a_y * y + (1 - a_y) * y_prev
+
+    return x_hat, y_hat, dx_hat, dy_hat
 
 
 class OneEuroFilter:
-    def __init__(self, t0=0.0, x0=0.0, dx0=0.0, min_cutoff=1.0, beta=0.0,
-                 d_cutoff=1.0):
-        """Initialize the one euro filter."""
+    def __init__(self, t0=0.0, x0=0.0, y0=0.0, dx0=0.0, dy0=0.0, min_cutoff=1.0,
+                 beta=0.0, d_cutoff=1.0):
+        """Initialize the one euro filter for a 2D point."""
         # The parameters.
         self._min_cutoff = float(min_cutoff)
         self._beta = float(beta)
@@ -22,45 +40,71 @@ class OneEuroFilter:
         # Previous values.
         self._t_prev = t0
         self._x_prev = x0
+        self._y_prev = y0
         self._dx_prev = dx0
+        self._dy_prev = dy0
 
-    def __call__(self, t: float, x: float) -> float:
+    def __call__(self, t: float, x: float, y: float) -> tuple[float, float]:
         if not self._t_prev:
             self._t_prev = t
             self._x_prev = x
-            return x
+            self._y_prev = y
+            return x, y
 
         """Compute the filtered signal."""
-        t_e = t - self._t_prev
-
-        # The filtered derivative of the signal.
-        a_d = _smoothing_factor(t_e, self._d_cutoff)
-        dx = (x - self._x_prev) / t_e
-        dx_hat = _exponential_smoothing(a_d, dx, self._dx_prev)
-
-        # The filtered signal.
-        cutoff = self._min_cutoff + self._beta * abs(dx_hat)
-        a = _smoothing_factor(t_e, cutoff)
-        x_hat = _exponential_smoothing(a, x, self._x_prev)
+        x_hat, y_hat, self._dx_prev, self._dy_prev = _one_euro_step(
+            t - self._t_prev, x, y, self._x_prev, self._y_prev, self._dx_prev, self._dy_prev,
+            self._min_cutoff, self._beta, self._d_cutoff
+        )
 
         # Memorize the previous values.
         self._x_prev = x_hat
-        self._dx_prev = dx_hat
+        self._y_prev = y_hat
         self._t_prev = t
 
-        return x_hat
+        return x_hat, y_hat
+
+
+@njit(cache=True, nogil=True)
+def _ivt_step(buffer, head, count, x_sum, y_sum, fix_x, fix_y, t_e, x, y, v_threshold):
+    # Compare squared distance against squared threshold distance to avoid sqrt
+    dx = x - fix_x
+    dy = y - fix_y
+    max_distance = v_threshold * t_e
+    if dx * dx + dy * dy >= max_distance * max_distance:
+        # A saccade starts a new, empty fixation at this sample
+        return 0, 0, 0.0, 0.0, x, y
+
+    window_size = buffer.shape[0]
+    if count == window_size:
+        # The oldest sample is about to be overwritten; keep the sums in step
+        x_sum -= float(buffer[head, 0])
+        y_sum -= float(buffer[head, 1])
+    else:
+        count += 1
+    buffer[head, 0] = x
+    buffer[head, 1] = y
+    x_sum += x
+    y_sum += y
+
+    return (head + 1) % window_size, count, x_sum, y_sum, x_sum / count, y_sum / count
 
 
 class IvtFilter:
+    WINDOW_SIZE = 100
+
     def __init__(self, v_threshold=1):
+        # Ring buffer of the (x, y) samples in the current fixation, allocated once
+        self._buffer = np.zeros((self.WINDOW_SIZE, 2))
         self.init()
-        self._v_threshold = v_threshold
+        self._v_threshold = float(v_threshold)
 
     def init(self, t0=0.0, x0=0.0, y0=0.0):
-        self._queue: deque[tuple[float, float]] = deque(maxlen=100)
+        self._head = 0
+        self._count = 0
         self._t_prev = t0
-        self._gaze_x_sum: float = 0
-        self._gaze_y_sum: float = 0
+        self._gaze_x_sum: float = 0.0
+        self._gaze_y_sum: float = 0.0
         self._fixation = x0, y0
 
     def __call__(self, t: float, x: float, y: float) -> tuple[float, float]:
@@ -68,14 +112,11 @@ class IvtFilter:
             self.init(t, x, y)
             return x, y
 
-        if sqrt((x - self._fixation[0]) ** 2 + (y - self._fixation[1]) ** 2) / (t - self._t_prev) >= self._v_threshold:
-            self.init(t, x, y)
-        else:
-            self._queue.append((x, y))
-            self._gaze_x_sum += x
-            self._gaze_y_sum += y
-            self._fixation: tuple[float, float] = (self._gaze_x_sum / len(self._queue), self._gaze_y_sum / len(self._queue))
-
+        self._head, self._count, self._gaze_x_sum, self._gaze_y_sum, fix_x, fix_y = _ivt_step(
+            self._buffer, self._head, self._count, self._gaze_x_sum, self._gaze_y_sum,
+            self._fixation[0], self._fixation[1], t - self._t_prev, x, y, self._v_threshold
+        )
+        self._fixation: tuple[float, float] = (fix_x, fix_y)
         self._t_prev = t
 
         return self._fixation
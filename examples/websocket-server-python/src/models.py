@@ -1,41 +1,42 @@
 from dataclasses import dataclass
 from typing import Dict, Optional, Tuple
-from math import isnan
 
+import msgspec
 
+
+# NaN is the only float that is not equal to itself, so `value == value` is a cheap NaN check
 def _nan_to_none(value):
-    return None if isnan(value) else value
+    return value if value == value else None
 
 
-@dataclass
-class EyePosition:
+class EyePosition(msgspec.Struct, frozen=True, gc=False):
     x: float
     y: float
     z: float
 
     @property
     def is_valid(self) -> bool:
-        return not (isnan(self.x) or isnan(self.y) or isnan(self.z))
+        return self.x == self.x and self.y == self.y and self.z == self.z
 
     def to_dict(self) -> Dict[str, Optional[float]]:
         return {"x": _nan_to_none(self.x), "y": _nan_to_none(self.y), "z": _nan_to_none(self.z)}
 
 
-@dataclass
+# GazePoint stays a dataclass: it is a FastAPI request body and is updated in place per sample
+@dataclass(slots=True)
 class GazePoint:
     x: float
     y: float
 
     @property
     def is_valid(self) -> bool:
-        return not (isnan(self.x) or isnan(self.y))
+        return self.x == self.x and self.y == self.y
 
     def to_dict(self) -> Dict[str, Optional[float]]:
         return {"x": _nan_to_none(self.x), "y": _nan_to_none(self.y)}
 
 
-@dataclass
-class EyeData:
+class EyeData(msgspec.Struct, frozen=True, gc=False):
     gaze_point_on_display_area: Tuple[float, float]
     gaze_point_in_user_coordinate_system: Tuple[float, float, float]
     gaze_point_validity: int
@@ -57,8 +58,7 @@ class EyeData:
         return self.gaze_origin_validity == 1
 
 
-@dataclass
-class UserPositionData:
+class UserPositionData(msgspec.Struct, frozen=True, gc=False):
     left_user_position: Tuple[float, float, float]
     left_user_position_validity: int
     right_user_position: Tuple[float, float, float]
@@ -73,8 +73,7 @@ class UserPositionData:
         return self.right_user_position_validity == 1
 
 
-@dataclass
-class TobiiGazeData:
+class TobiiGazeData(msgspec.Struct, frozen=True, gc=False):
     device_time_stamp: int
     system_time_stamp: int
     left_eye: EyeData
@@ -82,30 +81,25 @@ class TobiiGazeData:
 
     @classmethod
     def from_dict(cls, data: Dict) -> 'TobiiGazeData':
+        # Positional arguments (in field order) skip msgspec's keyword matching
         left_eye = EyeData(
-            gaze_point_on_display_area=data['left_gaze_point_on_display_area'],
-            gaze_point_in_user_coordinate_system=data['left_gaze_point_in_user_coordinate_system'],
-            gaze_point_validity=data['left_gaze_point_validity'],
-            pupil_diameter=data['left_pupil_diameter'],
-            pupil_validity=data['left_pupil_validity'],
-            gaze_origin_in_user_coordinate_system=data['left_gaze_origin_in_user_coordinate_system'],
-            gaze_origin_validity=data['left_gaze_origin_validity']
+            data['left_gaze_point_on_display_area'],
+            data['left_gaze_point_in_user_coordinate_system'],
+            data['left_gaze_point_validity'],
+            data['left_pupil_diameter'],
+            data['left_pupil_validity'],
+            data['left_gaze_origin_in_user_coordinate_system'],
+            data['left_gaze_origin_validity']
         )
         
         right_eye = EyeData(
-            gaze_point_on_display_area=data['right_gaze_point_on_display_area'],
-            gaze_point_in_user_coordinate_system=data['right_gaze_point_in_user_coordinate_system'],
-            gaze_point_validity=data['right_gaze_point_validity'],
-            pupil_diameter=data['right_pupil_diameter'],
-            pupil_validity=data['right_pupil_validity'],
-            gaze_origin_in_user_coordinate_system=data['right_gaze_origin_in_user_coordinate_system'],
-            gaze_origin_validity=data['right_gaze_origin_validity']
+            data['right_gaze_point_on_display_area'],
+            data['right_gaze_point_in_user_coordinate_system'],
+            data['right_gaze_point_validity'],
+            data['right_pupil_diameter'],
+            data['right_pupil_validity'],
+            data['right_gaze_origin_in_user_coordinate_system'],
+            data['right_gaze_origin_validity']
         )
         
-        return cls(
-            device_time_stamp=data['device_time_stamp'],
-            system_time_stamp=data['system_time_stamp'],
-            left_eye=left_eye,
-            right_eye=right_eye
-        )
-
+        return cls(data['device_time_stamp'], data['system_time_stamp'], left_eye, right_eye)
@@ -7,8 +7,7 @@ from .gaze_filter import OneEuroFilter, IvtFilter
 from .models import EyePosition, GazePoint, TobiiGazeData, UserPositionData
 from .config import CALIBRATION_POINTS
 
-oe_filter_x = OneEuroFilter()
-oe_filter_y = OneEuroFilter()
+oe_filter = OneEuroFilter()
 ivt_filter = IvtFilter(v_threshold=2)
 
 # Updated callback type to include full gaze data
@@ -42,37 +41,35 @@ class TobiiProEyeTracker:
         # Use system timestamp from eye tracker
         self.current_timestamp = gaze_data_raw["system_time_stamp"] / 1000000.0  # Convert to seconds
 
-        # Create structured gaze data
-        gaze_data = TobiiGazeData.from_dict(gaze_data_raw)
-
         # Get individual eye gaze points
-        left_x, left_y = gaze_data.left_eye.gaze_point_on_display_area
-        right_x, right_y = gaze_data.right_eye.gaze_point_on_display_area
+        left_x, left_y = gaze_data_raw["left_gaze_point_on_display_area"]
+        right_x, right_y = gaze_data_raw["right_gaze_point_on_display_area"]
 
-        # Store individual eye gaze points
-        self.left_gaze_point = GazePoint(x=left_x, y=left_y)
-        self.right_gaze_point = GazePoint(x=right_x, y=right_y)
+        # Store individual eye gaze points (updated in place to avoid per-sample allocations)
+        self.left_gaze_point.x, self.left_gaze_point.y = left_x, left_y
+        self.right_gaze_point.x, self.right_gaze_point.y = right_x, right_y
 
         # Calculate average gaze point
         x = (left_x + right_x) / 2
         y = (left_y + right_y) / 2
 
         if isnan(x) or isnan(y):
-            self.gaze_point = GazePoint(x=x, y=y)
-            self.fixation_point = GazePoint(x=x, y=y)
+            self.gaze_point.x, self.gaze_point.y = x, y
+            self.fixation_point.x, self.fixation_point.y = x, y
             return
 
         # Jitter filter
-        x = oe_filter_x(self.current_timestamp, x)
-        y = oe_filter_y(self.current_timestamp, y)
-        self.gaze_point = GazePoint(x=x, y=y)
+        x, y = oe_filter(self.current_timestamp, x, y)
+        self.gaze_point.x, self.gaze_point.y = x, y
 
         # Fixation filter
-        fp = ivt_filter(self.current_timestamp / 1000000, x, y)
-        self.fixation_point = GazePoint(x=fp[0], y=fp[1])
+        self.fixation_point.x, self.fixation_point.y = ivt_filter(self.current_timestamp / 1000000, x, y)
 
-        if self.on_gaze_data:
-            self.on_gaze_data(gaze_data)
+        # Structured gaze data is only needed by the listener, so build it lazily.
+        # Read the listener once: another thread may detach it between the check and the call.
+        callback = self.on_gaze_data
+        if callback:
+            callback(TobiiGazeData.from_dict(gaze_data_raw))
 
 
     def user_position_guide_callback(self, user_position_guide_raw):
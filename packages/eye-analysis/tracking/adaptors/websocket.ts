@@ -94,6 +94,7 @@ export const websocketTrackingAdaptor = (
 ): DataProcessingAdaptor => {
   let websocket: WebSocket | null = null
   let reconnectTimer: ReturnType<typeof setTimeout> | null = null
+  const textDecoder = new TextDecoder()
 
   const adaptorId = `websocket-${url}`
   const wsUrl = normalizeWebSocketURL(url, options.urlSuffix)
@@ -109,6 +110,8 @@ export const websocketTrackingAdaptor = (
       return new Promise((resolve, reject) => {
         try {
           websocket = new WebSocket(wsUrl)
+          // Servers may send JSON as binary frames; receive them as ArrayBuffer
+          websocket.binaryType = "arraybuffer"
 
           const timeout = setTimeout(() => {
             websocket?.close()
@@ -159,10 +162,21 @@ export const websocketTrackingAdaptor = (
 
           websocket.onmessage = async (event) => {
             try {
-              const rawData = JSON.parse(event.data)
-              const gazeInput = await adaptor.processRawData(rawData)
-              if (gazeInput) {
-                await handleGazeData(gazeInput, adaptor.id)
+              const text =
+                typeof event.data === "string"
+                  ? event.data
+                  : textDecoder.decode(event.data as ArrayBuffer)
+              const rawData = JSON.parse(text)
+              // Servers may combine several samples into one batch message
+              const samples: unknown[] =
+                rawData?.type === "batch" && Array.isArray(rawData.samples)
+                  ? rawData.samples
+                  : [rawData]
+              for (const sample of samples) {
+                const gazeInput = await adaptor.processRawData(sample)
+                if (gazeInput) {
+                  await handleGazeData(gazeInput, adaptor.id)
+                }
               }
             } catch (error) {
               handleTrackingError(adaptorId, error as Error)